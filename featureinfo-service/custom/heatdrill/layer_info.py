@@ -15,6 +15,13 @@ conf = {
 }
 
 log = logging.getLogger(__name__)
+log.setLevel(conf['loglevel'])
+
+# Session shared across queries so connections are pooled and the
+# retry adapter applies to every request
+session = requests.Session()
+session.mount('http://', HTTPAdapter(max_retries=3))
+session.mount('https://', HTTPAdapter(max_retries=3))
 
 def layer_info(layer, x, y, crs, params, identity):
     """Query the heatdrill-service and return info result as dict:
@@ -51,8 +58,6 @@ def layer_info(layer, x, y, crs, params, identity):
     x = round(x)
     y = round(y)
 
-    log.setLevel(conf['loglevel'])
-
     try:
         url = _buildServiceRequest(x, y)
         log.debug('Calling service ' + url)
@@ -141,12 +146,7 @@ def _queryService(url):
     """
     res = None
 
-    from requests.adapters import HTTPAdapter
-
-    s = requests.Session()
-    s.mount(url, HTTPAdapter(max_retries=3))
-
-    resp = requests.get(url, timeout=conf['timeout'])
+    resp = session.get(url, timeout=conf['timeout'])
 
     if resp.status_code != 200:
         resp.raise_for_status()